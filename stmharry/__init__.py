@@ -1 +1,13 @@
-import stmharry.logging  # noqa
+import importlib
+from types import ModuleType
+
+__all__ = ["logging"]
+
+
+# submodules are imported lazily (PEP 562) so that `import stmharry` does not pull
+#   in `absl` and `rich` until they are actually used
+def __getattr__(name: str) -> ModuleType:
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"Module {__name__!r} has no attribute {name!r}!")
@@ -1,4 +1,7 @@
+import functools
 import importlib
+import logging as std_logging
+import sys
 import types
 from pathlib import Path
 from types import ModuleType
@@ -18,9 +21,18 @@ import yaml
 from absl import logging
 from pydantic import BaseModel, Extra, Field, parse_obj_as
 
+try:
+    from yaml import CDumper as Dumper
+    from yaml import CUnsafeLoader as UnsafeLoader
+
+except ImportError:
+    from yaml import Dumper, UnsafeLoader  # type: ignore
+
 T_GENERIC = TypeVar("T_GENERIC")
 T_CONFIG = TypeVar("T_CONFIG", bound="BaseConfig")
 
+_OBJECT_CONFIG_EXCLUDE: set[str] = {"obj_cls"}
+
 
 class GenericAlias(Protocol):
     __origin__: Type[object]
@@ -37,6 +49,13 @@ def is_indirect_generic_subclass(
     return bases is not None and isinstance(bases, tuple)
 
 
+@functools.cache
+def _generic_type(cls: type) -> Type:
+    assert is_indirect_generic_subclass(cls)
+
+    return get_args(cls.__orig_bases__[0])[0]
+
+
 def _import_module_native(module_name: str) -> ModuleType | None:
     try:
         return importlib.import_module(module_name)
@@ -69,6 +88,45 @@ def import_module(module_name: str) -> ModuleType:
     raise ModuleNotFoundError(f"Module {module_name} not found!")
 
 
+@functools.cache
+def _import_module_cached(module_name: str) -> ModuleType | None:
+    try:
+        return import_module(module_name)
+
+    except ModuleNotFoundError:
+        # missing modules are cached as well
+        return None
+
+
+def _is_initializing(module: ModuleType) -> bool:
+    spec = getattr(module, "__spec__", None)
+    return getattr(spec, "_initializing", False) is True
+
+
+def _resolve_class(path: str) -> Type | None:
+    module_name: str
+    obj_name: str
+    (module_name, _, obj_name) = path.rpartition(".")
+
+    if module_name == "":
+        module_name = "__main__"
+
+    # look up `sys.modules` first to avoid going through the import machinery
+    module: ModuleType | None = sys.modules.get(module_name)
+    if module is None:
+        module = _import_module_cached(module_name)
+
+    elif _is_initializing(module):
+        # this waits for the module to finish initializing (e.g. in another thread)
+        module = importlib.import_module(module_name)
+
+    if module is None:
+        return None
+
+    # the attribute lookup is never cached, as it may be defined later
+    return getattr(module, obj_name, None)
+
+
 class ClassConfig(object):
     @classmethod
     def __get_validators__(cls) -> Generator[Callable, None, None]:
@@ -76,21 +134,17 @@ class ClassConfig(object):
 
     @classmethod
     def validate(cls, v: Any) -> Type:
+        # already resolved, e.g. when re-validating an existing config
+        if isinstance(v, type):
+            return v
+
         if not isinstance(v, str):
             raise ValueError(f"Expected string, got {v}!")
 
-        module_name: str
-        obj_name: str
-        (module_name, _, obj_name) = v.rpartition(".")
-
-        if module_name == "":
-            module_name = "__main__"
-
-        module: ModuleType = import_module(module_name)
-        obj_cls = getattr(module, obj_name, None)
+        obj_cls: Type | None = _resolve_class(v)
 
         if obj_cls is None:
-            raise ValueError(f"Referenced class {module_name} not found!")
+            raise ValueError(f"Referenced class {v} not found!")
 
         return obj_cls
 
@@ -99,41 +153,47 @@ class ObjectConfig(Generic[T_GENERIC], BaseModel):
     obj_cls: ClassConfig = Field(alias="__class__", repr=False)
 
     def instantiate(self, **kwargs: Any) -> T_GENERIC:
-        obj_dict: dict = self.dict()
+        # nested configs are instantiated directly, so keep them out of `dict` to
+        #   avoid materializing their whole subtree first
+        config_dict: dict[str, Any] = {
+            field_name: field_value
+            for (field_name, field_value) in self.__dict__.items()
+            if isinstance(field_value, ObjectConfig)
+            or (isinstance(field_value, dict) and ("__class__" in field_value))
+        }
+        obj_dict: dict = self.dict(exclude=set(config_dict)) | config_dict
 
         assert isinstance(self.obj_cls, type)
 
-        logging.info(
-            f"Creating object '{self.obj_cls.__name__}' from config {obj_dict}."
-        )
-
-        for field_name in obj_dict.keys():
-            field_value: Any = getattr(self, field_name)
+        # formatting the config can be expensive, so skip it when it would be dropped
+        if logging.get_absl_logger().isEnabledFor(std_logging.INFO):
+            logging.info(
+                f"Creating object '{self.obj_cls.__name__}' from config {obj_dict}."
+            )
 
-            if isinstance(field_value, dict) and ("__class__" in field_value):
+        field_value: Any
+        for field_name, field_value in config_dict.items():
+            if isinstance(field_value, dict):
                 logging.info(
                     f"Detected object '{field_name}' of type '{field_value['__class__']}'."
                 )
                 field_value = parse_obj_as(
-                    types.new_class(field_name, (ObjectConfig[object],)), field_value
+                    _object_config_subclass(field_name), field_value
                 )
 
             # use `ObjectConfig.create` if field is of type `ObjectConfig`
-            if isinstance(field_value, ObjectConfig):
-                obj_dict[field_name] = field_value.instantiate()
+            obj_dict[field_name] = field_value.instantiate()
 
         if kwargs is not None:
             obj_dict.update(kwargs)
 
-        assert is_indirect_generic_subclass(self.__class__)
-
         if hasattr(self.obj_cls, "create"):
             # TODO: this is a hack to avoid `mypy` error
             obj = self.obj_cls.create(**obj_dict)  # type: ignore
         else:
             obj = self.obj_cls(**obj_dict)
 
-        type_T: Type[T_GENERIC] = get_args(self.__class__.__orig_bases__[0])[0]
+        type_T: Type[T_GENERIC] = _generic_type(self.__class__)
         if not isinstance(obj, type_T):
             logging.fatal(
                 f"Object {obj} is not a sub-class of config-specificed class '{type_T}'!"
@@ -151,7 +211,7 @@ class ObjectConfig(Generic[T_GENERIC], BaseModel):
         if exclude is None:
             exclude = set()
 
-        exclude = exclude | {"obj_cls"}
+        exclude = exclude | _OBJECT_CONFIG_EXCLUDE
 
         return super().dict(*args, exclude=exclude, **kwargs)
 
@@ -160,15 +220,20 @@ class ObjectConfig(Generic[T_GENERIC], BaseModel):
         arbitrary_types_allowed = True
 
 
+@functools.cache
+def _object_config_subclass(name: str) -> Type[ObjectConfig[object]]:
+    return types.new_class(name, (ObjectConfig[object],))
+
+
 class BaseConfig(BaseModel):
     @classmethod
     def parse_yaml(cls: Type[T_CONFIG], path: str | Path) -> T_CONFIG:
         logging.info(f"Loading config from path {path!s}")
 
         with open(path, "r") as f:
-            obj: dict = yaml.unsafe_load(f)
+            obj: dict = yaml.load(f, Loader=UnsafeLoader)
 
         return cls.parse_obj(obj=obj)
 
     def to_yaml(self) -> str:
-        return yaml.dump(self.dict(by_alias=True))
+        return yaml.dump(self.dict(by_alias=True), Dumper=Dumper)
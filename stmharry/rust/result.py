@@ -7,7 +7,8 @@ T = TypeVar("T")
 E = TypeVar("E", bound=Exception)
 
 
-@dataclasses.dataclass(frozen=True)
+# `slots=True` as these are allocated on every call
+@dataclasses.dataclass(frozen=True, slots=True)
 class Ok(Generic[T, E]):
     value: T
 
@@ -29,7 +30,7 @@ class Ok(Generic[T, E]):
         return self.unwrap()
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Err(Generic[T, E]):
     err: E
 
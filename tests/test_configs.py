@@ -0,0 +1,183 @@
+import collections
+import logging as std_logging
+import sys
+import types
+from typing import Any
+
+import pytest
+from absl import logging
+from pydantic import BaseModel, parse_obj_as
+
+from stmharry.configs import BaseConfig, ClassConfig, ObjectConfig
+from stmharry.logging import patch_logging
+
+
+class Inner(object):
+    def __init__(self, a: int) -> None:
+        self.a = a
+
+
+def test_class_config_resolves_dotted_path():
+    assert ClassConfig.validate(f"{__name__}.Inner") is Inner
+    assert ClassConfig.validate("collections.OrderedDict") is collections.OrderedDict
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        f"{__name__}.Missing",
+        "stmharry_missing_module.Missing",
+    ],
+)
+def test_class_config_not_found(path):
+    with pytest.raises(ValueError, match="not found"):
+        ClassConfig.validate(path)
+
+
+def test_class_config_attribute_defined_later(monkeypatch):
+    module = types.ModuleType("stmharry_test_module")
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+
+    with pytest.raises(ValueError, match="not found"):
+        ClassConfig.validate(f"{module.__name__}.Later")
+
+    Later = type("Later", (object,), {})
+    setattr(module, "Later", Later)
+
+    assert ClassConfig.validate(f"{module.__name__}.Later") is Later
+
+
+class Payload(object):
+    def __init__(self, a: int) -> None:
+        self.a = a
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Payload) and self.a == other.a
+
+
+class YamlConfig(BaseConfig):
+    name: str
+    mapping: dict[int, str]
+    payload: Any = None
+
+
+def test_base_config_yaml_round_trip(tmp_path):
+    config = YamlConfig(name="x", mapping={1: "a"}, payload=Payload(a=2))
+
+    yaml_str: str = config.to_yaml()
+    assert yaml_str == (
+        "mapping:\n"
+        "  1: a\n"
+        "name: x\n"
+        f"payload: !!python/object:{__name__}.Payload\n"
+        "  a: 2\n"
+    )
+
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml_str)
+    assert YamlConfig.parse_yaml(path) == config
+
+
+class Item(BaseModel):
+    a: int
+
+
+class Collector(object):
+    def __init__(self, items: list, values: list[int]) -> None:
+        self.items = items
+        self.values = values
+
+        self.values.append(0)
+
+
+class CollectorConfig(ObjectConfig[Collector]):
+    items: list[Item]
+    values: list[int]
+
+
+def test_object_config_instantiate_copies_fields():
+    config = parse_obj_as(
+        CollectorConfig,
+        {"__class__": f"{__name__}.Collector", "items": [{"a": 2}], "values": [1]},
+    )
+
+    obj: Collector = config.instantiate()
+    assert obj.items == [{"a": 2}]
+    assert obj.values == [1, 0]
+
+    # mutating the arguments should not leak back into the config
+    assert config.values == [1]
+    assert config.instantiate().values == [1, 0]
+
+
+class Outer(object):
+    def __init__(self, inner: Inner, b: int) -> None:
+        self.inner = inner
+        self.b = b
+
+
+class OuterConfig(ObjectConfig[Outer]):
+    b: int
+
+
+def test_class_config_passes_through_types():
+    assert ClassConfig.validate(Inner) is Inner
+
+    config = parse_obj_as(OuterConfig, {"__class__": Outer, "b": 1})
+    assert config.obj_cls is Outer
+
+
+def test_object_config_instantiate_nested():
+    config = parse_obj_as(
+        OuterConfig,
+        {
+            "__class__": f"{__name__}.Outer",
+            "inner": {"__class__": f"{__name__}.Inner", "a": 2},
+            "b": 1,
+        },
+    )
+
+    obj: Outer = config.instantiate()
+    assert isinstance(obj, Outer)
+    assert isinstance(obj.inner, Inner)
+    assert obj.inner.a == 2
+    assert obj.b == 1
+
+    # repeated instantiation reuses the cached nested config class
+    assert isinstance(config.instantiate().inner, Inner)
+    assert config.instantiate(b=3).b == 3
+
+
+def test_object_config_instantiate_type_mismatch(monkeypatch):
+    def _fatal(msg: str, *args: Any, **kwargs: Any) -> None:
+        raise RuntimeError(msg)
+
+    monkeypatch.setattr(logging, "fatal", _fatal)
+
+    config = parse_obj_as(OuterConfig, {"__class__": "builtins.dict", "b": 1})
+    with pytest.raises(RuntimeError, match="not a sub-class"):
+        config.instantiate()
+
+
+class DictConfig(ObjectConfig[dict]):
+    pass
+
+
+def test_object_config_instantiate_logs_under_patch_logging(caplog):
+    root = std_logging.getLogger()
+    (handlers, level) = (root.handlers[:], root.level)
+
+    # `basicConfig` is a no-op when the root logger already has handlers
+    root.handlers.clear()
+    try:
+        patch_logging()
+        root.addHandler(caplog.handler)
+
+        config = parse_obj_as(DictConfig, {"__class__": "builtins.dict", "a": 1})
+        assert config.instantiate() == {"a": 1}
+
+    finally:
+        root.handlers[:] = handlers
+        root.setLevel(level)
+
+    assert "Creating object 'dict' from config {'a': 1}." in caplog.messages
@@ -1,3 +1,5 @@
+import dataclasses
+
 import pytest
 
 from stmharry.rust.result import Err, Ok, Result, returns_result
@@ -56,3 +58,19 @@ def test_full(numerator, denominator, expected):
             assert err.args == expected.args
             assert result.unwrap_or(0) == 0
             assert result.unwrap_or_else(lambda err: 0) == 0
+
+
+def test_frozen():
+    result: Result = Ok(1)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.value = 2  # type: ignore
+
+    assert result == Ok(1)
+    assert hash(result) == hash(Ok(1))
+    assert {result: 0}[Ok(1)] == 0
+    assert dataclasses.replace(result, value=2) == Ok(2)
+    assert not hasattr(result, "__dict__")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        Err(ValueError("error")).err = ValueError("other")  # type: ignore